@@ -8,16 +8,13 @@ json_array = [
 ]
 
 # Generate HTML table
-html_table = "<table border='1'>\n"
-html_table += "<tr><th>Name</th><th>Age</th></tr>\n"
+html_rows = ["<table border='1'>\n", "<tr><th>Name</th><th>Age</th></tr>\n"]
 
 for item in json_array:
-    html_table += "<tr>"
-    html_table += f"<td>{item['name']}</td>"
-    html_table += f"<td>{item['age']}</td>"
-    html_table += "</tr>\n"
+    html_rows.append(f"<tr><td>{item['name']}</td><td>{item['age']}</td></tr>\n")
 
-html_table += "</table>"
+html_rows.append("</table>")
+html_table = "".join(html_rows)
 
 # Print or save the HTML table
 print(html_table)
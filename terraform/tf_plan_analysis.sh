@@ -22,31 +22,29 @@ terraform show -json $PLAN_FILE > $PLAN_JSON
 echo "Analyzing plan for resource changes..."
 echo "------------------------------------"
 
-# Count the number of each type of change
-create_count=$(jq '[.resource_changes[] | select(.change.actions[0] == "create")] | length' $PLAN_JSON)
-update_count=$(jq '[.resource_changes[] | select(.change.actions[0] == "update")] | length' $PLAN_JSON)
-delete_count=$(jq '[.resource_changes[] | select(.change.actions[0] == "delete")] | length' $PLAN_JSON)
-
-# List resources by type and action
-echo "Summary of planned changes:"
-echo "Resources to be created: $create_count"
-echo "Resources to be updated: $update_count"
-echo "Resources to be deleted: $delete_count"
-
-echo
-echo "Detailed list of resources by action type:"
-echo "------------------------------------------"
-
-echo "Resources to be created:"
-jq -r '.resource_changes[] | select(.change.actions[0] == "create") | .address' $PLAN_JSON
-
-echo
-echo "Resources to be updated:"
-jq -r '.resource_changes[] | select(.change.actions[0] == "update") | .address' $PLAN_JSON
-
-echo
-echo "Resources to be deleted:"
-jq -r '.resource_changes[] | select(.change.actions[0] == "delete") | .address' $PLAN_JSON
+# Parse the plan once and bucket resource addresses by action, then render
+# the summary and detailed lists from those buckets
+jq -r '
+  (.resource_changes // []) as $changes
+  | [$changes[] | select(.change.actions[0] == "create") | .address] as $create
+  | [$changes[] | select(.change.actions[0] == "update") | .address] as $update
+  | [$changes[] | select(.change.actions[0] == "delete") | .address] as $delete
+  | "Summary of planned changes:",
+    "Resources to be created: \($create | length)",
+    "Resources to be updated: \($update | length)",
+    "Resources to be deleted: \($delete | length)",
+    "",
+    "Detailed list of resources by action type:",
+    "------------------------------------------",
+    "Resources to be created:",
+    $create[],
+    "",
+    "Resources to be updated:",
+    $update[],
+    "",
+    "Resources to be deleted:",
+    $delete[]
+' $PLAN_JSON
 
 # Clean up plan file and JSON output (optional)
 rm -f $PLAN_FILE $PLAN_JSON